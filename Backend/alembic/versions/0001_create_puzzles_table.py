@@ -0,0 +1,43 @@
+"""create puzzles table
+
+The original schema, with both boards stored as JSON. Databases that were
+set up by Base.metadata.create_all() before migrations existed already
+look like this: run `alembic stamp 0001` on them once, then upgrade.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-14 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "puzzles",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("initial_board", sa.JSON(), nullable=False),
+        sa.Column("solved_board", sa.JSON(), nullable=True),
+        sa.Column("is_solvable", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.Column("solve_time_ms", sa.Integer(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_puzzles_id", "puzzles", ["id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_puzzles_id", table_name="puzzles")
+    op.drop_table("puzzles")
@@ -0,0 +1,102 @@
+"""pack boards into bytea and add the history index
+
+Converts initial_board/solved_board from JSON to 41-byte packed BYTEA
+(see models.PackedBoard) by copying every row through pack_board(), and
+creates the covering index /puzzles/history reads from.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-14 00:00:01
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Rows are converted this many at a time so a big table isn't loaded at once
+BATCH_SIZE = 1000
+
+
+# Copies of models.pack_board / unpack_board: a migration must keep doing
+# exactly what it did when it was written, even if the app code changes.
+def pack_board(board):
+    flat = [num for row in board for num in row]
+    flat.append(0)
+    return bytes((flat[i] << 4) | flat[i + 1] for i in range(0, 82, 2))
+
+
+def unpack_board(data):
+    flat = [n for byte in data for n in (byte >> 4, byte & 0x0F)]
+    return [flat[r * 9:r * 9 + 9] for r in range(9)]
+
+
+def _convert(old_type, new_type, convert):
+    """
+    Re-types both board columns: add new ones, copy every row through
+    'convert', drop the old ones and put the new ones in their place.
+    """
+    op.add_column("puzzles", sa.Column("initial_board_new", new_type, nullable=True))
+    op.add_column("puzzles", sa.Column("solved_board_new", new_type, nullable=True))
+
+    puzzles = sa.table(
+        "puzzles",
+        sa.column("id", sa.Integer),
+        sa.column("initial_board", old_type),
+        sa.column("solved_board", old_type),
+        sa.column("initial_board_new", new_type),
+        sa.column("solved_board_new", new_type),
+    )
+    conn = op.get_bind()
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            sa.select(puzzles.c.id, puzzles.c.initial_board, puzzles.c.solved_board)
+            .where(puzzles.c.id > last_id)
+            .order_by(puzzles.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        conn.execute(
+            puzzles.update()
+            .where(puzzles.c.id == sa.bindparam("row_id"))
+            .values(initial_board_new=sa.bindparam("initial"), solved_board_new=sa.bindparam("solved")),
+            [
+                {
+                    "row_id": row.id,
+                    "initial": convert(row.initial_board),
+                    "solved": convert(row.solved_board) if row.solved_board is not None else None,
+                }
+                for row in rows
+            ],
+        )
+        last_id = rows[-1].id
+
+    op.drop_column("puzzles", "initial_board")
+    op.drop_column("puzzles", "solved_board")
+    op.alter_column("puzzles", "initial_board_new", new_column_name="initial_board", nullable=False)
+    op.alter_column("puzzles", "solved_board_new", new_column_name="solved_board")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _convert(sa.JSON(none_as_null=True), sa.LargeBinary(), pack_board)
+    op.create_index(
+        "ix_puzzles_id_created",
+        "puzzles",
+        [sa.text("id DESC"), "created_at", "is_solvable", "solve_time_ms"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_puzzles_id_created", table_name="puzzles")
+    _convert(sa.LargeBinary(), sa.JSON(none_as_null=True), unpack_board)
@@ -0,0 +1,150 @@
+import logging
+import os
+import time
+from typing import Optional
+
+import orjson
+import redis.asyncio as redis
+import xxhash
+from dotenv import load_dotenv
+
+load_dotenv()  # Reads the .env file into environment variables
+
+logger = logging.getLogger(__name__)
+
+# redis://host:port/db — leave it unset to run without a cache.
+# Every helper below quietly does nothing when there's no client, and
+# treats a Redis error as a miss, so the endpoints work the same either
+# way (just slower) — even if Redis goes down while the app is running.
+REDIS_URL = os.getenv("REDIS_URL")
+
+# Fail fast when Redis is unreachable rather than holding up the request
+REDIS_TIMEOUT_SECONDS = 0.5
+# After a Redis error every helper skips Redis for this long. Otherwise a
+# dead (or blackholed) server would cost each call its own timeout — up
+# to three in a row for one /solve. With the cooldown, only the requests
+# already talking to Redis when it fails wait (at most one timeout per
+# call); everything in the next 30 s goes straight to the database.
+REDIS_COOLDOWN_SECONDS = 30
+
+# time.monotonic() value until which Redis is considered down
+_down_until = 0.0
+
+# Solved puzzles never change, so they can sit in the cache for a while
+PUZZLE_TTL_SECONDS = 3600
+HISTORY_TTL_SECONDS = 3600
+# A board's solution is fixed forever; a day keeps popular puzzles warm
+SOLUTION_TTL_SECONDS = 86400
+
+# Instead of deleting every history page when a puzzle is added, we bump
+# this counter. Page keys include it, so old pages just stop being read
+# and expire on their own.
+HISTORY_VERSION_KEY = "history:version"
+
+
+def create_client() -> Optional[redis.Redis]:
+    """Creates the Redis client the app keeps for its whole lifetime."""
+    if not REDIS_URL:
+        return None
+    return redis.from_url(
+        REDIS_URL,
+        socket_connect_timeout=REDIS_TIMEOUT_SECONDS,
+        socket_timeout=REDIS_TIMEOUT_SECONDS,
+    )
+
+
+def _available(client: Optional[redis.Redis]) -> bool:
+    """True if there is a client and Redis hasn't failed in the last cooldown."""
+    return client is not None and time.monotonic() >= _down_until
+
+
+def _mark_down():
+    """Called on any Redis error: skip Redis until the cooldown is over."""
+    global _down_until
+    _down_until = time.monotonic() + REDIS_COOLDOWN_SECONDS
+
+
+def puzzle_key(puzzle_id: int) -> str:
+    return f"puzzle:{puzzle_id}"
+
+
+def solution_key(board: list[list[int]]) -> str:
+    """
+    Same board, same key: the 81 cells as 81 bytes, hashed with xxh3.
+    Lets /solve skip the solver for puzzles someone has already sent.
+    """
+    digest = xxhash.xxh3_64(bytes(num for row in board for num in row)).hexdigest()
+    return f"sol:{digest}"
+
+
+async def history_key(client: Optional[redis.Redis], cursor: Optional[int], skip: int, limit: int) -> str:
+    version = None
+    if _available(client):
+        try:
+            version = await client.get(HISTORY_VERSION_KEY)
+        except redis.RedisError:
+            _mark_down()
+            logger.warning("Redis unavailable, reading history version failed", exc_info=True)
+    return f"history:{int(version or 0)}:{cursor or ''}:{skip}:{limit}"
+
+
+async def get_cached(client: Optional[redis.Redis], key: str) -> Optional[bytes]:
+    """Returns the cached JSON for 'key', or None on a miss."""
+    if not _available(client):
+        return None
+    try:
+        return await client.get(key)
+    except redis.RedisError:
+        _mark_down()
+        logger.warning("Redis unavailable, treating %s as a miss", key, exc_info=True)
+        return None
+
+
+async def set_cached(client: Optional[redis.Redis], key: str, payload: bytes, ttl: int):
+    """Stores encoded JSON under 'key' for 'ttl' seconds."""
+    if not _available(client):
+        return
+    try:
+        await client.set(key, payload, ex=ttl)
+    except redis.RedisError:
+        _mark_down()
+        logger.warning("Redis unavailable, not caching %s", key, exc_info=True)
+
+
+async def get_solution(client: Optional[redis.Redis], board: list[list[int]]) -> Optional[tuple[bool, Optional[list[list[int]]]]]:
+    """
+    Returns a remembered (solvable, solved_board) for this exact board,
+    or None if we haven't seen it — or the cached entry can't be read,
+    in which case /solve just runs the solver as usual.
+    """
+    cached = await get_cached(client, solution_key(board))
+    if cached is None:
+        return None
+    try:
+        solution = orjson.loads(cached)
+        return solution["solvable"], solution["solved_board"]
+    except (orjson.JSONDecodeError, KeyError, TypeError):
+        logger.warning("Ignoring unreadable cached solution", exc_info=True)
+        return None
+
+
+async def set_solution(client: Optional[redis.Redis], board: list[list[int]], solvable: bool, solved_board):
+    """Remembers the answer for this board so repeats skip the solver."""
+    payload = orjson.dumps({"solvable": solvable, "solved_board": solved_board})
+    await set_cached(client, solution_key(board), payload, SOLUTION_TTL_SECONDS)
+
+
+async def invalidate_history(client: Optional[redis.Redis]):
+    """
+    Called whenever a puzzle is saved, so /history shows it.
+    This runs after the puzzle is committed, so a Redis error must not
+    turn a successful save into a 500; cached pages then expire by TTL
+    (the same goes for saves made during the cooldown).
+    """
+    if not _available(client):
+        return
+    try:
+        await client.incr(HISTORY_VERSION_KEY)
+    except redis.RedisError:
+        _mark_down()
+        logger.warning("Redis unavailable, history cache not invalidated", exc_info=True)
@@ -1,27 +1,75 @@
-from sqlalchemy.orm import Session
+from typing import Optional
+from sqlalchemy import insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 from . import models, schemas
 
-def create_puzzle(db: Session, initial_board, solved_board, is_solvable, solve_time_ms):
-    """Creates a new puzzle record in the database."""
-    db_puzzle = models.Puzzle(
+async def _skip_commit_fsync(db: AsyncSession):
+    """
+    By default every COMMIT waits for PostgreSQL to flush its log to disk.
+    For puzzle history that wait costs far more than the insert itself,
+    and losing the last fraction of a second of puzzles in a crash is fine.
+    SET LOCAL only applies to the current transaction, so anything else
+    (e.g. a future payments table) keeps full durability.
+    """
+    if db.bind.dialect.name == "postgresql":
+        await db.execute(text("SET LOCAL synchronous_commit = off"))
+
+async def create_puzzle(db: AsyncSession, initial_board, solved_board, is_solvable, solve_time_ms):
+    """
+    Creates a new puzzle record in the database.
+    INSERT ... RETURNING gives us the auto-generated id, created_at, etc.
+    in the same round-trip, so there's no need to reload the row afterwards.
+    """
+    stmt = insert(models.Puzzle).values(
         initial_board=initial_board,
         solved_board=solved_board,
         is_solvable=is_solvable,
         solve_time_ms=solve_time_ms
-    )
-    db.add(db_puzzle)       # Stage the new record
-    db.commit()             # Actually write it to PostgreSQL
-    db.refresh(db_puzzle)   # Reload it so we get the auto-generated id, created_at, etc.
+    ).returning(models.Puzzle)
+    await _skip_commit_fsync(db)
+    db_puzzle = await db.scalar(stmt)   # Write it and get the full row back
+    await db.commit()                   # Make it permanent in PostgreSQL
     return db_puzzle
 
-def get_puzzle(db: Session, puzzle_id: int):
+async def create_puzzles_bulk(db: AsyncSession, rows: list[dict]):
+    """
+    Creates many puzzle records in one go.
+    Each dict in 'rows' has the same keys as create_puzzle's arguments.
+    All rows go out as a single multi-row INSERT and one COMMIT, and
+    RETURNING hands back the generated id/created_at — no refresh needed.
+    """
+    await _skip_commit_fsync(db)
+    # sort_by_parameter_order: rows come back in the same order as 'rows',
+    # so callers can match each result to the board they sent
+    result = await db.scalars(
+        insert(models.Puzzle).returning(models.Puzzle, sort_by_parameter_order=True), rows
+    )
+    db_puzzles = result.all()
+    await db.commit()
+    return db_puzzles
+
+async def get_puzzle(db: AsyncSession, puzzle_id: int):
     """Fetch a single puzzle by its ID."""
-    return db.query(models.Puzzle).filter(models.Puzzle.id == puzzle_id).first()
+    result = await db.execute(select(models.Puzzle).filter(models.Puzzle.id == puzzle_id))
+    return result.scalars().first()
 
-def get_all_puzzles(db: Session, skip: int = 0, limit: int = 20):
+async def get_all_puzzles(db: AsyncSession, cursor: Optional[int] = None, skip: int = 0, limit: int = 20):
     """
-    Fetch multiple puzzles with pagination.
-    'skip' and 'limit' let the client request "page 2" without
-    loading thousands of records into memory at once.
+    Fetch multiple puzzles with pagination, newest first.
+    'cursor' is the id of the last puzzle on the previous page: we return
+    the next 'limit' puzzles with a smaller id (no cursor = first page).
+    Postgres can jump straight there through the primary key index,
+    unlike OFFSET which has to walk past every skipped row.
+    'skip' still works on top for older clients.
+
+    The boards are deferred (left out of the SELECT): the history list
+    only shows the small columns, which all come straight from the index.
     """
-    return db.query(models.Puzzle).offset(skip).limit(limit).all()
\ No newline at end of file
+    stmt = select(models.Puzzle).options(
+        defer(models.Puzzle.initial_board), defer(models.Puzzle.solved_board)
+    )
+    if cursor is not None:
+        stmt = stmt.filter(models.Puzzle.id < cursor)
+    result = await db.execute(stmt.order_by(models.Puzzle.id.desc()).offset(skip).limit(limit))
+    return result.scalars().all()
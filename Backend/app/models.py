@@ -1,7 +1,45 @@
-from sqlalchemy import Column, Integer, String, DateTime, JSON
+from sqlalchemy import Column, Index, Integer, String, DateTime, LargeBinary
 from sqlalchemy.sql import func
+from sqlalchemy.types import TypeDecorator
 from .database import Base  # The '.' means "from the same package"
 
+
+# Every cell is 0-9, which fits in 4 bits, so two cells share one byte:
+# 81 cells -> 41 bytes (the last byte's low half is padding).
+# _NIBBLES[byte] gives back the two cells a byte holds.
+_NIBBLES = tuple((byte >> 4, byte & 0x0F) for byte in range(256))
+
+
+def pack_board(board: list[list[int]]) -> bytes:
+    """Packs a 9x9 board into 41 bytes, two cells per byte."""
+    flat = [num for row in board for num in row]
+    flat.append(0)
+    return bytes((flat[i] << 4) | flat[i + 1] for i in range(0, 82, 2))
+
+
+def unpack_board(data: bytes) -> list[list[int]]:
+    """Turns 41 packed bytes back into a 9x9 board."""
+    flat = [num for byte in data for num in _NIBBLES[byte]]
+    return [flat[r * 9:r * 9 + 9] for r in range(9)]
+
+
+class PackedBoard(TypeDecorator):
+    """
+    A column type that looks like a 9x9 list in Python but is stored as
+    41 bytes of BYTEA in PostgreSQL — about a quarter of the size of the
+    same board as JSON text, and no JSON parsing on the way in or out.
+    SQLAlchemy calls these two methods for us on every write and read.
+    """
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return pack_board(value) if value is not None else None
+
+    def process_result_value(self, value, dialect):
+        return unpack_board(value) if value is not None else None
+
+
 class Puzzle(Base):
     """
     This class maps directly to a 'puzzles' table in PostgreSQL.
@@ -12,13 +50,20 @@ class Puzzle(Base):
     
     id = Column(Integer, primary_key=True, index=True)
     
-    # JSON column stores the 9x9 board as a Python list directly
-    # PostgreSQL has native JSON support — very powerful
-    initial_board = Column(JSON, nullable=False)
-    solved_board = Column(JSON, nullable=True)  # Null if unsolvable
+    # PackedBoard (above) stores the 9x9 board as 41 bytes,
+    # but we still read and write it as a plain Python list
+    initial_board = Column(PackedBoard, nullable=False)
+    solved_board = Column(PackedBoard, nullable=True)  # Null if unsolvable
     
     is_solvable = Column(String, default="unknown")  # 'yes', 'no', 'unknown'
     
     # func.now() tells the DB to automatically set this to the current time
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    solve_time_ms = Column(Integer, nullable=True)  # How fast did we solve it?
\ No newline at end of file
+    solve_time_ms = Column(Integer, nullable=True)  # How fast did we solve it?
+    
+    # /history lists puzzles newest-first. This index is in that order and
+    # also carries the small columns the list shows, so Postgres can read
+    # them without visiting the table rows.
+    __table_args__ = (
+        Index("ix_puzzles_id_created", id.desc(), created_at, is_solvable, solve_time_ms),
+    )
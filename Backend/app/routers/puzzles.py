@@ -1,20 +1,42 @@
+import asyncio
 import time
-import copy
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from typing import Annotated, Optional
+from fastapi import APIRouter, Body, Depends, HTTPException, Path, Query, Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..database import get_db       # '..' means "go up one level"
-from ..schemas import PuzzleSubmit, PuzzleResponse
-from ..solver import solve, validate_puzzle
-from .. import crud
+from ..schemas import PuzzleSubmit, PuzzleResponse, PuzzleSummary
+from ..solver import validate_puzzle
+from ..solver_numba import solve_and_return
+from .. import cache, crud
 
 # A Router is like a mini-app — it groups related endpoints.
 # We'll attach this to the main app in main.py
 router = APIRouter(prefix="/puzzles", tags=["puzzles"])
 
+# The endpoints that build their own JSON (so it can be cached) reuse these.
+# A TypeAdapter builds its validator/serializer once; dump_json then turns
+# a whole list of ORM rows into JSON bytes in a single pass inside
+# pydantic-core, the same encoder FastAPI uses for response_model.
+_PUZZLE = TypeAdapter(PuzzleResponse)
+_HISTORY = TypeAdapter(list[PuzzleSummary])
+
+# Most boards one /solve_batch request may send. Every board is a solver
+# job plus an INSERT row, so an unbounded list could tie up the worker
+# pool and the database with a single request.
+MAX_BATCH_SIZE = 100
+
+
+def _solve_timed(board: list[list[int]]):
+    """Runs on a worker thread: solve one board and time just the solve."""
+    start_time = time.time()
+    solvable, solved_board = solve_and_return(board)
+    return solvable, solved_board, int((time.time() - start_time) * 1000)
+
 
 @router.post("/solve", response_model=PuzzleResponse)
-def solve_puzzle(puzzle: PuzzleSubmit, db: Session = Depends(get_db)):
+async def solve_puzzle(puzzle: PuzzleSubmit, request: Request, db: AsyncSession = Depends(get_db)):
     """
     POST /puzzles/solve
     
@@ -27,38 +49,138 @@ def solve_puzzle(puzzle: PuzzleSubmit, db: Session = Depends(get_db)):
     """
     
     # Validate the puzzle isn't already broken
-    board_copy = copy.deepcopy(puzzle.board)  # deepcopy so we don't modify the original
-    if not validate_puzzle(board_copy):
+    # validate_puzzle only reads the board, so no copy is needed
+    if not validate_puzzle(puzzle.board):
         raise HTTPException(status_code=400, detail="Invalid puzzle: contains conflicts")
     
-    # Time the solving process — great data to store!
-    board_to_solve = copy.deepcopy(puzzle.board)
-    start_time = time.time()
-    solvable = solve(board_to_solve)
-    elapsed_ms = int((time.time() - start_time) * 1000)
+    # Someone may have sent this exact board before — reuse that answer
+    # (a Redis outage just means a miss — we solve it ourselves)
+    redis = request.app.state.redis
+    solution = await cache.get_solution(redis, puzzle.board)
+    if solution is not None:
+        (solvable, solved_board), elapsed_ms = solution, 0
+    else:
+        # Time the solving process — great data to store!
+        # Solving is CPU work, so it runs on the app's worker pool instead of
+        # the event loop — other requests keep being served in the meantime.
+        # _solve_timed starts the clock on the worker, so time spent waiting
+        # for a free thread isn't counted (same as /solve_batch).
+        loop = asyncio.get_running_loop()
+        solvable, solved_board, elapsed_ms = await loop.run_in_executor(
+            request.app.state.solver_pool, _solve_timed, puzzle.board
+        )
+        await cache.set_solution(redis, puzzle.board, solvable, solved_board)
     
     # Save to database and return
-    db_puzzle = crud.create_puzzle(
+    db_puzzle = await crud.create_puzzle(
         db=db,
         initial_board=puzzle.board,
-        solved_board=board_to_solve if solvable else None,
+        solved_board=solved_board,
         is_solvable="yes" if solvable else "no",
         solve_time_ms=elapsed_ms
     )
+    await cache.invalidate_history(redis)
     
     return db_puzzle
 
 
-@router.get("/history", response_model=list[PuzzleResponse])
-def get_history(skip: int = 0, limit: int = 20, db: Session = Depends(get_db)):
-    """GET /puzzles/history — returns past puzzles with pagination."""
-    return crud.get_all_puzzles(db, skip=skip, limit=limit)
+@router.post("/solve_batch", response_model=list[PuzzleResponse])
+async def solve_puzzle_batch(
+    puzzles: Annotated[list[PuzzleSubmit], Body(max_length=MAX_BATCH_SIZE)],
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    POST /puzzles/solve_batch
+
+    Like /solve, but for a whole list of boards at once (up to
+    MAX_BATCH_SIZE; a longer list is rejected with a 422).
+    Every board is solved in parallel on the worker pool, then all the
+    results are saved with a single INSERT instead of one per puzzle.
+    """
+    for index, puzzle in enumerate(puzzles):
+        if not validate_puzzle(puzzle.board):
+            raise HTTPException(
+                status_code=400, detail=f"Invalid puzzle at index {index}: contains conflicts"
+            )
+
+    loop = asyncio.get_running_loop()
+    pool = request.app.state.solver_pool
+    results = await asyncio.gather(
+        *(loop.run_in_executor(pool, _solve_timed, puzzle.board) for puzzle in puzzles)
+    )
+
+    rows = [
+        {
+            "initial_board": puzzle.board,
+            "solved_board": solved_board,
+            "is_solvable": "yes" if solvable else "no",
+            "solve_time_ms": elapsed_ms,
+        }
+        for puzzle, (solvable, solved_board, elapsed_ms) in zip(puzzles, results)
+    ]
+    if not rows:
+        return []
+    db_puzzles = await crud.create_puzzles_bulk(db, rows)
+    await cache.invalidate_history(request.app.state.redis)
+    return db_puzzles
+
+
+@router.get("/history", response_model=list[PuzzleSummary])
+async def get_history(
+    request: Request,
+    # ids are int4 in Postgres, so anything outside 1..2**31-1 is a 422, not a DB error
+    cursor: Optional[int] = Query(default=None, ge=1, le=2**31 - 1),
+    skip: int = 0,
+    limit: int = 20,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    GET /puzzles/history — returns past puzzles, newest first.
+    GET /puzzles/history?cursor=120 — the page after the puzzle with id 120.
+
+    Each entry is a PuzzleSummary (no boards); use GET /puzzles/{id} for those.
+
+    The value to pass as 'cursor' for the next page comes back in the
+    X-Next-Cursor header (it's missing once there are no more puzzles).
+    Pages are cached in Redis until the next puzzle is saved.
+    """
+    redis = request.app.state.redis
+    key = await cache.history_key(redis, cursor, skip, limit)
+    cached = await cache.get_cached(redis, key)
+    if cached is not None:
+        # Cached as "<next cursor> <json body>" so the header survives too
+        next_cursor, _, payload = cached.partition(b" ")
+    else:
+        puzzles = await crud.get_all_puzzles(db, cursor=cursor, skip=skip, limit=limit)
+        next_cursor = str(puzzles[-1].id).encode() if puzzles else b""
+        payload = _HISTORY.dump_json(_HISTORY.validate_python(puzzles, from_attributes=True))
+        await cache.set_cached(redis, key, next_cursor + b" " + payload, cache.HISTORY_TTL_SECONDS)
+
+    headers = {"X-Next-Cursor": next_cursor.decode()} if next_cursor else None
+    return Response(content=payload, media_type="application/json", headers=headers)
 
 
 @router.get("/{puzzle_id}", response_model=PuzzleResponse)
-def get_puzzle(puzzle_id: int, db: Session = Depends(get_db)):
-    """GET /puzzles/42 — returns one specific puzzle by ID."""
-    puzzle = crud.get_puzzle(db, puzzle_id)
+async def get_puzzle(
+    request: Request,
+    # Same int4 bound as /history's cursor: out-of-range ids are a 422, not a DB error
+    puzzle_id: int = Path(ge=1, le=2**31 - 1),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    GET /puzzles/42 — returns one specific puzzle by ID.
+    Puzzles never change once saved, so they're served from Redis when possible.
+    """
+    redis = request.app.state.redis
+    key = cache.puzzle_key(puzzle_id)
+    cached = await cache.get_cached(redis, key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    puzzle = await crud.get_puzzle(db, puzzle_id)
     if puzzle is None:
         raise HTTPException(status_code=404, detail="Puzzle not found")
-    return puzzle
\ No newline at end of file
+    payload = _PUZZLE.dump_json(_PUZZLE.validate_python(puzzle, from_attributes=True))
+    await cache.set_cached(redis, key, payload, cache.PUZZLE_TTL_SECONDS)
+    return Response(content=payload, media_type="application/json")
@@ -1,29 +1,20 @@
-from pydantic import BaseModel, validator
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Annotated, Optional
 from datetime import datetime
 
+# A 9x9 grid of digits 0-9, described entirely as type constraints.
+# pydantic-core (written in Rust) checks the shape and the range of every
+# cell itself, so no Python validator code runs per request.
+Cell = Annotated[int, Field(ge=0, le=9)]
+Row = Annotated[list[Cell], Field(min_length=9, max_length=9)]
+Board = Annotated[list[Row], Field(min_length=9, max_length=9)]
+
 class PuzzleSubmit(BaseModel):
     """
     What we expect to RECEIVE when someone submits a puzzle to solve.
-    The 'board' must be a 9x9 grid of integers.
+    The 'board' must be a 9x9 grid of integers between 0 and 9.
     """
-    board: list[list[int]]
-    
-    @validator('board')
-    def validate_board_shape(cls, board):
-        """
-        Custom validation: beyond just types, we check the actual structure.
-        Pydantic runs this automatically before any endpoint function runs.
-        """
-        if len(board) != 9:
-            raise ValueError("Board must have exactly 9 rows")
-        for row in board:
-            if len(row) != 9:
-                raise ValueError("Each row must have exactly 9 columns")
-            for cell in row:
-                if not (0 <= cell <= 9):
-                    raise ValueError("All values must be between 0 and 9")
-        return board
+    board: Board
 
 class PuzzleResponse(BaseModel):
     """
@@ -37,7 +28,19 @@ class PuzzleResponse(BaseModel):
     solve_time_ms: Optional[int]
     created_at: datetime
     
-    class Config:
-        # This tells Pydantic to read data from SQLAlchemy model attributes,
-        # not just plain dictionaries. Without this, conversion would fail.
-        from_attributes = True
\ No newline at end of file
+    # This tells Pydantic to read data from SQLAlchemy model attributes,
+    # not just plain dictionaries. Without this, conversion would fail.
+    model_config = ConfigDict(from_attributes=True)
+
+class PuzzleSummary(BaseModel):
+    """
+    One row of /puzzles/history: everything except the two boards.
+    The history list never draws the grids, so there's no point sending
+    (or even loading) them — open a single puzzle to get those.
+    """
+    id: int
+    is_solvable: str
+    solve_time_ms: Optional[int]
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
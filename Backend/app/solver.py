@@ -1,5 +1,14 @@
 from typing import Optional
 
+# Lookup tables for validate_puzzle below. _BOX[i] is the 3x3 box of flat
+# cell number i (row i // 9, column i % 9); the grid is always 9x9, so we
+# work these out once at import instead of dividing on every step.
+_BOX = tuple((i // 27) * 3 + (i % 9) // 3 for i in range(81))
+
+# _BIT[num] is the mask bit for digit num. Bit 0 is unused because 0
+# marks an empty cell.
+_BIT = tuple(1 << num for num in range(10))
+
 def solve(board: list[list[int]]) -> bool:
     """
     Solves the Sudoku board in-place using backtracking.
@@ -88,17 +97,25 @@ def validate_puzzle(board: list[list[int]]) -> bool:
     Checks that the initial puzzle is valid before we try to solve it.
     This is separate from is_valid() — that checks during solving.
     This checks the starting state has no conflicts.
+
+    One pass over the board: we remember which digits each row, column
+    and box already has as bits of an int, and fail as soon as a digit
+    shows up twice. The board itself is never modified.
     """
+    row_mask = [0] * 9
+    col_mask = [0] * 9
+    box_mask = [0] * 9
     for row in range(9):
         for col in range(9):
             num = board[row][col]
-            if num != 0:
-                # Temporarily remove the number, then check if it's valid
-                # We remove it first because is_valid checks if num is already
-                # present — it would always find itself otherwise
-                board[row][col] = 0
-                if not is_valid(board, row, col, num):
-                    board[row][col] = num  # Restore before returning
-                    return False
-                board[row][col] = num  # Restore
-    return True
\ No newline at end of file
+            if num == 0:
+                continue
+            bit = _BIT[num]
+            box = _BOX[row * 9 + col]
+            if (row_mask[row] | col_mask[col] | box_mask[box]) & bit:
+                return False
+            row_mask[row] |= bit
+            col_mask[col] |= bit
+            box_mask[box] |= bit
+    return True
+